@@ -1,9 +1,26 @@
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
+import matplotlib
+
+# Render off-screen unless attached to a terminal; figures are only shown interactively
+INTERACTIVE = sys.stdout.isatty()
+if not INTERACTIVE:
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import seaborn as sns
-import statsmodels.api as sm
+import matplotlib.dates as mdates
+from matplotlib.transforms import Bbox
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy import stats
+from numba import njit
+
+# Bold axis labels and titles for every figure, set once instead of per call
+plt.rcParams.update({'axes.labelweight': 'bold', 'axes.titleweight': 'bold'})
+
+DPI = int(os.environ.get('FIG_DPI', 150))
 
 print("=" * 70)
 print("INDIA'S INFLATION VS. GOLD PRICES: COMPLETE ANALYSIS")
@@ -15,31 +32,33 @@ print("=" * 70)
 print("\n[Step 1] Loading datasets...")
 
 # ---------- GOLD DATA ----------
-df_gold = pd.read_csv('gold_prices.csv')
+# thousands=',' parses prices like "1,279.20" as floats while reading
+df_gold = pd.read_csv('gold_prices.csv', thousands=',')
 print(f"Gold data shape: {df_gold.shape}")
 print(f"Gold columns: {df_gold.columns.tolist()}")
 
-# Parse gold dates (handle several formats, then normalize to month-start)
-for fmt in ["%b %Y", "%b %y", "%d/%m/%Y", "%Y-%m-%d"]:
-    try:
-        df_gold["Date"] = pd.to_datetime(df_gold["Date"], format=fmt)
-        break
-    except ValueError:
-        continue
-else:
-    df_gold["Date"] = pd.to_datetime(df_gold["Date"])  # fallback: infer
-
-# keep only needed columns and clean price
-if df_gold["Price"].dtype == "object":
-    df_gold["Price"] = (
-        df_gold["Price"].astype(str).str.replace(",", "", regex=False).astype(float)
-    )
+# Parse gold dates (sniff the format from the first value, parse the column
+# once, then normalize to month-start)
+DATE_FORMATS = {
+    re.compile(r"^[A-Za-z]{3} \d{4}$"): "%b %Y",
+    re.compile(r"^[A-Za-z]{3} \d{2}$"): "%b %y",
+    re.compile(r"^\d{1,2}/\d{1,2}/\d{4}$"): "%d/%m/%Y",
+    re.compile(r"^\d{4}-\d{2}-\d{2}$"): "%Y-%m-%d",
+}
+first_date = str(df_gold["Date"].dropna().iat[0]).strip()
+gold_date_fmt = next(
+    (fmt for pattern, fmt in DATE_FORMATS.items() if pattern.match(first_date)), None
+)
+try:
+    df_gold["Date"] = pd.to_datetime(df_gold["Date"], format=gold_date_fmt, cache=True)
+except ValueError:
+    df_gold["Date"] = pd.to_datetime(df_gold["Date"], cache=True)  # fallback: infer
 
 # normalize gold dates to monthly period (YYYY-MM-01)
 df_gold["Date"] = df_gold["Date"].values.astype("datetime64[M]")
 
 # ---------- CPI DATA ----------
-df_cpi = pd.read_csv('cpi_data.csv')
+df_cpi = pd.read_csv('cpi_data.csv', dtype={'CPI_Combined': 'float64'})
 print(f"CPI data shape: {df_cpi.shape}")
 print(f"CPI columns: {df_cpi.columns.tolist()}")
 
@@ -52,17 +71,25 @@ df_cpi["Date"] = df_cpi["Date"].values.astype("datetime64[M]")
 # ==========================================
 print("\n[Step 2] Merging datasets...")
 
-# Merge on Date
-df = pd.merge(df_gold, df_cpi, on='Date', how='inner')
+# Merge on an int16 months-since-epoch key (both Date columns are month-start),
+# so the join hashes small native integers instead of timestamps
+def month_key(dates):
+    return dates.values.astype('datetime64[M]').view('i8').astype('int16')
+
+df = pd.merge(
+    df_gold.assign(_mk=month_key(df_gold['Date'])),
+    df_cpi.assign(_mk=month_key(df_cpi['Date'])).drop(columns='Date'),
+    on='_mk', how='inner',
+).drop(columns='_mk')
 print(f"Merged data shape: {df.shape}")
 print(f"Date range: {df['Date'].min()} to {df['Date'].max()}")
 
 # Sort strictly by date
 df = df.sort_values('Date').reset_index(drop=True)
 
-# Check for gaps
-date_diffs = df['Date'].diff().dt.days
-if (date_diffs.dropna() > 50).any():
+# Check for gaps (dates are month-start, so diff whole months on the int64 view)
+month_diffs = np.diff(df['Date'].values.astype('datetime64[M]').view('i8'))
+if (month_diffs > 1).any():
     print("[WARNING] Possible date gaps detected!")
 else:
     print("[OK] Date sequence looks correct (monthly intervals)")
@@ -72,12 +99,22 @@ else:
 # ==========================================
 print("\n[Step 3] Calculating metrics...")
 
-# Monthly Returns (%)
-df['Inflation_Rate'] = df['CPI_Combined'].pct_change() * 100
-df['Gold_Returns'] = df['Price'].pct_change() * 100
-
-# Drop first row (NaN from pct_change)
-df = df.dropna()
+# Monthly Returns (%): (a[t] / a[t-1] - 1) * 100 for t >= 1, computed in place on one buffer
+def pct_returns(values):
+    values = np.asarray(values, dtype=float)
+    out = np.empty(len(values) - 1)
+    np.divide(values[1:], values[:-1], out=out)
+    out -= 1
+    out *= 100
+    # Inputs carry ~4 significant digits, so float32 loses nothing and halves the
+    # memory traffic of the rolling-window computations downstream
+    return out.astype(np.float32, copy=False)
+
+# The first month has no prior month, so keep rows 1..N with their returns
+df = df.iloc[1:].assign(
+    Inflation_Rate=pct_returns(df['CPI_Combined'].to_numpy()),
+    Gold_Returns=pct_returns(df['Price'].to_numpy()),
+).reset_index(drop=True)
 
 print(f"Analysis dataset: {len(df)} observations")
 print(f"Avg Monthly Inflation: {df['Inflation_Rate'].mean():.4f}%")
@@ -95,18 +132,23 @@ corr_coeff = df['Inflation_Rate'].corr(df['Gold_Returns'])
 print(f"\nOverall Correlation Coefficient: {corr_coeff:.4f}")
 
 # B. OLS REGRESSION: Gold_Returns = alpha + beta * Inflation
-X = sm.add_constant(df['Inflation_Rate'])
-y = df['Gold_Returns']
-model = sm.OLS(y, X).fit()
+# Single regressor + constant, so use the closed-form estimates
+x = df['Inflation_Rate'].to_numpy()
+y = df['Gold_Returns'].to_numpy()
+n_obs = len(x)
+xc = x - x.mean()
+yc = y - y.mean()
+sxx = xc @ xc
+beta = (xc @ yc) / sxx
+alpha = y.mean() - beta * x.mean()
+resid = y - (alpha + beta * x)
+ssr = resid @ resid
+se_beta = np.sqrt(ssr / (n_obs - 2) / sxx)
+beta_pvalue = 2 * stats.t.sf(abs(beta / se_beta), n_obs - 2)
+r_squared = 1 - ssr / (yc @ yc)
 
 print("\n--- OLS REGRESSION RESULTS ---")
-print(model.summary())
-
-# Extract key statistics
-r_squared = model.rsquared
-beta = model.params['Inflation_Rate']
-beta_pvalue = model.pvalues['Inflation_Rate']
-alpha = model.params['const']
+print(f"alpha={alpha:.4f} beta={beta:.4f} p={beta_pvalue:.4f} R-squared={r_squared:.4f}")
 
 print(f"\nKey Interpretation:")
 print(f"  Beta (Hedge Ratio): {beta:.4f}")
@@ -116,112 +158,143 @@ print(f"  R-squared: {r_squared:.4f} (Inflation explains {r_squared*100:.2f}% of
 # C. ROLLING CORRELATION
 print("\n[Step 4] Computing rolling statistics...")
 
-window_size = 12  # 12-month rolling window
-df['Rolling_Corr_12m'] = df['Inflation_Rate'].rolling(window=window_size).corr(df['Gold_Returns'])
-
-window_size = 24  # 24-month rolling window
-df['Rolling_Corr_24m'] = df['Inflation_Rate'].rolling(window=window_size).corr(df['Gold_Returns'])
+# Pearson correlation over every window at once on (N - w + 1, w) strided views
+def rolling_corr(x, y, window):
+    out = np.full(len(x), np.nan)
+    if len(x) < window:
+        return out
+    xw = sliding_window_view(x, window)
+    yw = sliding_window_view(y, window)
+    xd = xw - xw.mean(axis=1, keepdims=True)
+    yd = yw - yw.mean(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[window - 1:] = (xd * yd).sum(axis=1) / np.sqrt((xd * xd).sum(axis=1) * (yd * yd).sum(axis=1))
+    return out
+
+rolling_corr_12m = rolling_corr(x, y, 12)  # 12-month rolling window
+rolling_corr_24m = rolling_corr(x, y, 24)  # 24-month rolling window
 
 # D. HEDGE RATIO (Dynamic Beta)
 # Calculate rolling beta (sensitivity of Gold to Inflation)
+# Univariate OLS slope from running window sums, updated one month at a time:
+# beta = (n*Sxy - Sx*Sy) / (n*Sxx - Sx^2)
+@njit(cache=True, error_model='numpy')
+def rolling_beta_kernel(x, y, w):
+    n = len(x)
+    out = np.empty(n)
+    out[:w - 1] = np.nan
+    if n < w:
+        return out
+    sx = sy = sxy = sxx = 0.0
+    for i in range(w):
+        sx += x[i]
+        sy += y[i]
+        sxy += x[i] * y[i]
+        sxx += x[i] * x[i]
+    out[w - 1] = (w * sxy - sx * sy) / (w * sxx - sx * sx)
+    for i in range(w, n):
+        x_old, y_old = x[i - w], y[i - w]
+        sx += x[i] - x_old
+        sy += y[i] - y_old
+        sxy += x[i] * y[i] - x_old * y_old
+        sxx += x[i] * x[i] - x_old * x_old
+        out[i] = (w * sxy - sx * sy) / (w * sxx - sx * sx)
+    return out
+
 def rolling_beta(inflation, gold_returns, window=12):
-    betas = []
-    for i in range(len(inflation) - window + 1):
-        X_window = sm.add_constant(inflation.iloc[i:i+window])
-        y_window = gold_returns.iloc[i:i+window]
-        try:
-            model_window = sm.OLS(y_window, X_window).fit()
-            betas.append(model_window.params[1])
-        except:
-            betas.append(np.nan)
-    return [np.nan] * (window - 1) + betas
-
-df['Rolling_Beta_12m'] = rolling_beta(df['Inflation_Rate'], df['Gold_Returns'], window=12)
+    return rolling_beta_kernel(inflation.values, gold_returns.values, window)
+
+rolling_beta_12m = rolling_beta(df['Inflation_Rate'], df['Gold_Returns'], window=12)
 
 # ==========================================
-# 5. VISUALIZATION 1: Trend Comparison (Dual Axis)
+# 5. TIME-SERIES FIGURE: Trend, Rolling Correlation & Rolling Beta
 # ==========================================
 print("\n[Step 5] Generating visualizations...")
 
-fig, ax1 = plt.subplots(figsize=(14, 7))
-
+# Convert the shared date axis to Matplotlib's numeric form once, not per plot call
+date_x = mdates.date2num(df['Date'].values)
+duty_cut_date = pd.to_datetime('2024-07-01')
+duty_cut_x = mdates.date2num(duty_cut_date)
+
+# All date-based panels live on one canvas with a shared x-axis; charts 01 and 02
+# are cropped from it, so layout and date formatting are done once
+fig_ts, (ax_trend, ax_corr, ax_beta) = plt.subplots(
+    3, 1, figsize=(14, 17), sharex=True, gridspec_kw={'height_ratios': [7, 5, 5]}
+)
+ax_trend.xaxis_date()
+
+# Save the region of `fig` covered by `axes` (tight bbox incl. titles, labels, legends)
+def save_panels(fig, axes, filename):
+    renderer = fig.canvas.get_renderer()
+    bbox = Bbox.union([ax.get_tightbbox(renderer) for ax in axes])
+    fig.savefig(filename, dpi=DPI, bbox_inches=bbox.transformed(fig.dpi_scale_trans.inverted()).padded(0.1))
+
+# ---------- 01: Trend Comparison (Dual Axis) ----------
 color = 'tab:red'
-ax1.set_xlabel('Year', fontsize=12, fontweight='bold')
-ax1.set_ylabel('Gold Price (INR per 10g)', color=color, fontsize=12, fontweight='bold')
-line1 = ax1.plot(df['Date'], df['Price'], color=color, linewidth=2.5, label='Gold Price (MCX)')
-ax1.tick_params(axis='y', labelcolor=color)
-ax1.grid(True, alpha=0.3)
+ax_trend.set_xlabel('Year', fontsize=12)
+ax_trend.set_ylabel('Gold Price (INR per 10g)', color=color, fontsize=12)
+line1 = ax_trend.plot(date_x, df['Price'], color=color, linewidth=2.5, label='Gold Price (MCX)')
+ax_trend.tick_params(axis='y', labelcolor=color)
+ax_trend.tick_params(axis='x', labelbottom=True)
+ax_trend.grid(True, alpha=0.3)
 
 # Second Y-axis
-ax2 = ax1.twinx()
+ax_cpi = ax_trend.twinx()
 color = 'tab:blue'
-ax2.set_ylabel('CPI Index (2012=100)', color=color, fontsize=12, fontweight='bold')
-line2 = ax2.plot(df['Date'], df['CPI_Combined'], color=color, linestyle='--', linewidth=2.5, label='CPI Combined')
-ax2.tick_params(axis='y', labelcolor=color)
+ax_cpi.set_ylabel('CPI Index (2012=100)', color=color, fontsize=12)
+line2 = ax_cpi.plot(date_x, df['CPI_Combined'], color=color, linestyle='--', linewidth=2.5, label='CPI Combined')
+ax_cpi.tick_params(axis='y', labelcolor=color)
 
 # Highlight Duty Cut
-duty_cut_date = pd.to_datetime('2024-07-01')
-ax1.axvline(duty_cut_date, color='green', linestyle=':', linewidth=2, alpha=0.7, label='Import Duty Cut')
-ax1.text(duty_cut_date, df['Price'].max() * 0.95, ' Duty Cut\n(July 2024)', 
-         color='green', fontweight='bold', fontsize=10, va='top')
+ax_trend.axvline(duty_cut_x, color='green', linestyle=':', linewidth=2, alpha=0.7, label='Import Duty Cut')
+ax_trend.text(duty_cut_x, df['Price'].max() * 0.95, ' Duty Cut\n(July 2024)', 
+              color='green', fontweight='bold', fontsize=10, va='top')
 
-plt.title('Gold Price vs. CPI Level (2015-2025): Structural Break Analysis', 
-          fontsize=14, fontweight='bold', pad=20)
+ax_trend.set_title('Gold Price vs. CPI Level (2015-2025): Structural Break Analysis', 
+                   fontsize=14, pad=20)
 
 # Combined legend
 lines = line1 + line2
 labels = [l.get_label() for l in lines]
-ax1.legend(lines, labels, loc='upper left', fontsize=10)
-
-plt.tight_layout()
-plt.savefig('01_trend_comparison.png', dpi=300, bbox_inches='tight')
-print("[SAVED] Saved: 01_trend_comparison.png")
-plt.show()
-
-# ==========================================
-# 6. VISUALIZATION 2: Rolling Correlation
-# ==========================================
-
-fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
-
-# Plot 1: 12-month and 24-month rolling correlation
-ax1.plot(df['Date'], df['Rolling_Corr_12m'], color='navy', linewidth=2, label='12-Month Rolling Correlation')
-ax1.plot(df['Date'], df['Rolling_Corr_24m'], color='darkblue', linewidth=2, alpha=0.6, label='24-Month Rolling Correlation')
-ax1.axhline(0, color='red', linestyle='--', linewidth=1.5, alpha=0.7)
-ax1.axhline(corr_coeff, color='orange', linestyle='--', linewidth=1.5, alpha=0.5, label=f'Overall Corr: {corr_coeff:.3f}')
-ax1.axvline(duty_cut_date, color='green', linestyle=':', linewidth=2, alpha=0.7)
-ax1.fill_between(df['Date'], 0, df['Rolling_Corr_12m'], alpha=0.1, color='navy')
-ax1.set_ylabel('Correlation Coefficient', fontsize=11, fontweight='bold')
-ax1.set_title('Does Gold Act as an Inflation Hedge? Rolling Correlation Analysis', 
-              fontsize=13, fontweight='bold', pad=15)
-ax1.grid(True, alpha=0.3)
-ax1.legend(loc='upper left', fontsize=10)
-ax1.set_ylim(-1, 1)
-
-# Plot 2: Rolling Beta (Hedge Ratio)
-ax2.plot(df['Date'], df['Rolling_Beta_12m'], color='purple', linewidth=2, label='12-Month Rolling Beta')
-ax2.axhline(0, color='red', linestyle='--', linewidth=1.5, alpha=0.7)
-ax2.axhline(beta, color='orange', linestyle='--', linewidth=1.5, alpha=0.5, label=f'Overall Beta: {beta:.3f}')
-ax2.axhline(1.0, color='green', linestyle='--', linewidth=1, alpha=0.5, label='Perfect Hedge (Beta=1.0)')
-ax2.axvline(duty_cut_date, color='green', linestyle=':', linewidth=2, alpha=0.7)
-ax2.fill_between(df['Date'], 0, df['Rolling_Beta_12m'], alpha=0.1, color='purple')
-ax2.set_xlabel('Year', fontsize=11, fontweight='bold')
-ax2.set_ylabel('Regression Beta (Slope)', fontsize=11, fontweight='bold')
-ax2.set_title('Hedge Ratio Over Time: How Much Does Gold Rise Per 1% Inflation?', 
-              fontsize=13, fontweight='bold', pad=15)
-ax2.grid(True, alpha=0.3)
-ax2.legend(loc='upper left', fontsize=10)
-
-plt.tight_layout()
-plt.savefig('02_rolling_correlation_and_beta.png', dpi=300, bbox_inches='tight')
-print("[SAVED] Saved: 02_rolling_correlation_and_beta.png")
-plt.show()
+ax_trend.legend(lines, labels, loc='upper left', fontsize=10)
+
+# ---------- 02: Rolling Correlation ----------
+# 12-month and 24-month rolling correlation
+ax_corr.plot(date_x, rolling_corr_12m, color='navy', linewidth=2, label='12-Month Rolling Correlation')
+ax_corr.plot(date_x, rolling_corr_24m, color='darkblue', linewidth=2, alpha=0.6, label='24-Month Rolling Correlation')
+ax_corr.axhline(0, color='red', linestyle='--', linewidth=1.5, alpha=0.7)
+ax_corr.axhline(corr_coeff, color='orange', linestyle='--', linewidth=1.5, alpha=0.5, label=f'Overall Corr: {corr_coeff:.3f}')
+ax_corr.axvline(duty_cut_x, color='green', linestyle=':', linewidth=2, alpha=0.7)
+ax_corr.fill_between(date_x, 0, rolling_corr_12m, alpha=0.1, color='navy')
+ax_corr.set_ylabel('Correlation Coefficient', fontsize=11)
+ax_corr.set_title('Does Gold Act as an Inflation Hedge? Rolling Correlation Analysis', 
+                  fontsize=13, pad=15)
+ax_corr.tick_params(axis='x', labelbottom=True)
+ax_corr.grid(True, alpha=0.3)
+ax_corr.legend(loc='upper left', fontsize=10)
+ax_corr.set_ylim(-1, 1)
+
+# Rolling Beta (Hedge Ratio)
+ax_beta.plot(date_x, rolling_beta_12m, color='purple', linewidth=2, label='12-Month Rolling Beta')
+ax_beta.axhline(0, color='red', linestyle='--', linewidth=1.5, alpha=0.7)
+ax_beta.axhline(beta, color='orange', linestyle='--', linewidth=1.5, alpha=0.5, label=f'Overall Beta: {beta:.3f}')
+ax_beta.axhline(1.0, color='green', linestyle='--', linewidth=1, alpha=0.5, label='Perfect Hedge (Beta=1.0)')
+ax_beta.axvline(duty_cut_x, color='green', linestyle=':', linewidth=2, alpha=0.7)
+ax_beta.fill_between(date_x, 0, rolling_beta_12m, alpha=0.1, color='purple')
+ax_beta.set_xlabel('Year', fontsize=11)
+ax_beta.set_ylabel('Regression Beta (Slope)', fontsize=11)
+ax_beta.set_title('Hedge Ratio Over Time: How Much Does Gold Rise Per 1% Inflation?', 
+                  fontsize=13, pad=15)
+ax_beta.grid(True, alpha=0.3)
+ax_beta.legend(loc='upper left', fontsize=10)
+
+fig_ts.tight_layout()
 
 # ==========================================
 # 7. VISUALIZATION 3: Scatter Plot with Regression Line
 # ==========================================
 
-fig, ax = plt.subplots(figsize=(12, 8))
+fig_scatter, ax = plt.subplots(figsize=(12, 8))
 
 # Scatter plot
 ax.scatter(df['Inflation_Rate'], df['Gold_Returns'], alpha=0.6, s=60, color='steelblue', edgecolors='black', linewidth=0.5)
@@ -234,62 +307,94 @@ ax.plot(x_line, y_line, 'r--', linewidth=2.5, label=f'Regression: Gold = {alpha:
 ax.axhline(0, color='gray', linestyle='-', linewidth=0.5, alpha=0.5)
 ax.axvline(0, color='gray', linestyle='-', linewidth=0.5, alpha=0.5)
 
-ax.set_xlabel('Monthly Inflation Rate (%)', fontsize=12, fontweight='bold')
-ax.set_ylabel('Monthly Gold Returns (%)', fontsize=12, fontweight='bold')
+ax.set_xlabel('Monthly Inflation Rate (%)', fontsize=12)
+ax.set_ylabel('Monthly Gold Returns (%)', fontsize=12)
 ax.set_title(f'Gold Returns vs. Inflation: Weak Hedge Evidence (r = {corr_coeff:.3f}, R-sq = {r_squared:.4f})', 
-             fontsize=13, fontweight='bold', pad=15)
+             fontsize=13, pad=15)
 ax.grid(True, alpha=0.3)
 ax.legend(fontsize=11, loc='upper left')
 
-plt.tight_layout()
-plt.savefig('03_regression_scatter.png', dpi=300, bbox_inches='tight')
+fig_scatter.tight_layout()
+
+# Figures are built sequentially above (Matplotlib figure construction is not
+# thread-safe); rasterizing and PNG-encoding the two independent figures can
+# overlap, since zlib compression releases the GIL. Both crops of the
+# time-series figure are saved by the same worker.
+def save_time_series():
+    save_panels(fig_ts, [ax_trend, ax_cpi], '01_trend_comparison.png')
+    save_panels(fig_ts, [ax_corr, ax_beta], '02_rolling_correlation_and_beta.png')
+
+def save_scatter():
+    fig_scatter.savefig('03_regression_scatter.png', dpi=DPI, bbox_inches='tight')
+
+with ThreadPoolExecutor(max_workers=2) as pool:
+    saves = [pool.submit(save_time_series), pool.submit(save_scatter)]
+for save in saves:
+    save.result()
+print("[SAVED] Saved: 01_trend_comparison.png")
+print("[SAVED] Saved: 02_rolling_correlation_and_beta.png")
 print("[SAVED] Saved: 03_regression_scatter.png")
-plt.show()
+
+if INTERACTIVE:
+    plt.show()
+plt.close(fig_ts)
+plt.close(fig_scatter)
 
 # ==========================================
 # 8. EXPORT RESULTS
 # ==========================================
 print("\n[Step 6] Exporting results...")
 
-# Save processed data
-df.to_csv('final_analysis_data.csv', index=False)
+# Save processed data (rolling statistics are kept as arrays until export)
+df.assign(
+    Rolling_Corr_12m=rolling_corr_12m,
+    Rolling_Corr_24m=rolling_corr_24m,
+    Rolling_Beta_12m=rolling_beta_12m,
+).to_csv('final_analysis_data.csv', index=False, float_format='%.6g')
 print("[SAVED] Saved: final_analysis_data.csv")
 
-# Summary statistics to text file
+# Summary statistics to text file (assembled in memory, written once)
+strength = 'WEAK' if abs(corr_coeff) < 0.3 else 'MODERATE' if abs(corr_coeff) < 0.6 else 'STRONG'
+significance = '(Statistically Significant at 5%)' if beta_pvalue < 0.05 else '(NOT Statistically Significant)'
+parts = [
+    "=" * 70,
+    "INDIA'S INFLATION VS. GOLD PRICES: STATISTICAL SUMMARY",
+    "=" * 70,
+    "",
+    f"Data Period: {df['Date'].min().strftime('%B %Y')} to {df['Date'].max().strftime('%B %Y')}",
+    f"Number of Observations: {len(df)}",
+    "",
+    "DESCRIPTIVE STATISTICS:",
+    f"  Inflation Rate: Mean = {df['Inflation_Rate'].mean():.4f}%, Std = {df['Inflation_Rate'].std():.4f}%",
+    f"  Gold Returns:   Mean = {df['Gold_Returns'].mean():.4f}%, Std = {df['Gold_Returns'].std():.4f}%",
+    "",
+    "KEY FINDINGS:",
+    f"1. Overall Correlation: {corr_coeff:.4f}",
+    f"   - Gold and inflation have a {strength} relationship",
+    "",
+    "2. Regression (Gold = alpha + beta * Inflation):",
+    f"   - Intercept (alpha):    {alpha:.4f}",
+    f"   - Beta (beta):         {beta:.4f}",
+    f"   - P-value:          {beta_pvalue:.4f} {significance}",
+    f"   - R-squared:        {r_squared:.4f}",
+    f"   - Interpretation: For every 1% rise in inflation, gold rises {beta:.2f}% on average",
+    "",
+    "3. Hedge Quality:",
+]
+if beta < 0.5:
+    parts.append(f"   - WEAK HEDGE: Gold only captures ~{beta*100:.0f}% of inflation")
+elif beta < 1.0:
+    parts.append(f"   - PARTIAL HEDGE: Gold captures ~{beta*100:.0f}% of inflation")
+else:
+    parts += ["   - STRONG HEDGE: Gold captures MORE than inflation (over-hedge)", ""]
+parts += [
+    "POLICY SHOCK:",
+    "   - July 2024 Import Duty Cut (15% -> 6%) caused artificial price suppression",
+    "   - Visible in rolling correlation plot: sharp drop after July 2024",
+]
+
 with open('analysis_summary.txt', 'w') as f:
-    f.write("=" * 70 + "\n")
-    f.write("INDIA'S INFLATION VS. GOLD PRICES: STATISTICAL SUMMARY\n")
-    f.write("=" * 70 + "\n\n")
-    
-    f.write(f"Data Period: {df['Date'].min().strftime('%B %Y')} to {df['Date'].max().strftime('%B %Y')}\n")
-    f.write(f"Number of Observations: {len(df)}\n\n")
-    
-    f.write("DESCRIPTIVE STATISTICS:\n")
-    f.write(f"  Inflation Rate: Mean = {df['Inflation_Rate'].mean():.4f}%, Std = {df['Inflation_Rate'].std():.4f}%\n")
-    f.write(f"  Gold Returns:   Mean = {df['Gold_Returns'].mean():.4f}%, Std = {df['Gold_Returns'].std():.4f}%\n\n")
-    
-    f.write("KEY FINDINGS:\n")
-    f.write(f"1. Overall Correlation: {corr_coeff:.4f}\n")
-    f.write(f"   - Gold and inflation have a {'WEAK' if abs(corr_coeff) < 0.3 else 'MODERATE' if abs(corr_coeff) < 0.6 else 'STRONG'} relationship\n\n")
-    
-    f.write(f"2. Regression (Gold = alpha + beta * Inflation):\n")
-    f.write(f"   - Intercept (alpha):    {alpha:.4f}\n")
-    f.write(f"   - Beta (beta):         {beta:.4f}\n")
-    f.write(f"   - P-value:          {beta_pvalue:.4f} {'(Statistically Significant at 5%)' if beta_pvalue < 0.05 else '(NOT Statistically Significant)'}\n")
-    f.write(f"   - R-squared:        {r_squared:.4f}\n")
-    f.write(f"   - Interpretation: For every 1% rise in inflation, gold rises {beta:.2f}% on average\n\n")
-    
-    f.write(f"3. Hedge Quality:\n")
-    if beta < 0.5:
-        f.write(f"   - WEAK HEDGE: Gold only captures ~{beta*100:.0f}% of inflation\n")
-    elif beta < 1.0:
-        f.write(f"   - PARTIAL HEDGE: Gold captures ~{beta*100:.0f}% of inflation\n")
-    else:
-        f.write(f"   - STRONG HEDGE: Gold captures MORE than inflation (over-hedge)\n\n")
-    
-    f.write("POLICY SHOCK:\n")
-    f.write(f"   - July 2024 Import Duty Cut (15% -> 6%) caused artificial price suppression\n")
-    f.write(f"   - Visible in rolling correlation plot: sharp drop after July 2024\n")
+    f.write("\n".join(parts) + "\n")
 
 print("[SAVED] Saved: analysis_summary.txt")
 